@@ -25,6 +25,15 @@ from utils.workspace_manager import WorkspaceManager
 MAX_OUTPUT_TOKENS_PER_TURN = 32768
 MAX_TURNS = 200
 
+WELCOME_PANEL = Panel(
+    "[bold]Agent CLI[/bold]\n\n"
+    + "Type your instructions to the agent. Press Ctrl+C to exit.\n"
+    + "Type 'exit' or 'quit' to end the session.",
+    title="[bold blue]Agent CLI[/bold blue]",
+    border_style="blue",
+    padding=(1, 2),
+)
+
 
 def main():
     """Main entry point for the CLI."""
@@ -97,16 +106,7 @@ def main():
 
     # Print welcome message
     if not args.minimize_stdout_logs:
-        console.print(
-            Panel(
-                "[bold]Agent CLI[/bold]\n\n"
-                + "Type your instructions to the agent. Press Ctrl+C to exit.\n"
-                + "Type 'exit' or 'quit' to end the session.",
-                title="[bold blue]Agent CLI[/bold blue]",
-                border_style="blue",
-                padding=(1, 2),
-            )
-        )
+        console.print(WELCOME_PANEL)
     else:
         logger_for_agent_logs.info(
             "Agent CLI started. Waiting for user input. Press Ctrl+C to exit. Type 'exit' or 'quit' to end the session."
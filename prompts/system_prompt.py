@@ -1,11 +1,13 @@
 import platform
 
+OS_NAME = platform.system()
+
 SYSTEM_PROMPT = f"""
 You are an AI assistant helping a software engineer implement pull requests,
 and you have access to tools to interact with the engineer's codebase.
 
 Working directory: {{workspace_root}}
-Operating system: {platform.system()}
+Operating system: {OS_NAME}
 
 Guidelines:
 - You are working in a codebase with other engineers and many different components. Be careful that changes you make in one component don't break other components.
@@ -40,15 +40,13 @@ try breaking down the task into smaller steps and call this tool multiple times.
     }
 
     def _get_system_prompt(self):
-        """Get the system prompt, including any pending messages.
+        """Get the system prompt, rendered once for the agent's workspace.
 
         Returns:
-            The system prompt with messages prepended if any
+            The system prompt with the workspace root filled in
         """
 
-        return SYSTEM_PROMPT.format(
-            workspace_root=self.workspace_manager.root,
-        )
+        return self._system_prompt
 
     def __init__(
         self,
@@ -78,6 +76,9 @@ try breaking down the task into smaller steps and call this tool multiple times.
         self.max_output_tokens = max_output_tokens_per_turn
         self.max_turns = max_turns
         self.workspace_manager = workspace_manager
+        self._system_prompt = SYSTEM_PROMPT.format(
+            workspace_root=workspace_manager.root,
+        )
         self.interrupted = False
         self.dialog = DialogMessages(
             logger_for_agent_logs=logger_for_agent_logs,
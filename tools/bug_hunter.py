@@ -4,14 +4,35 @@ in the agent's implementation and provide feedback.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
-from typing import Any, Optional, List
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, List
 from utils.common import LLMTool, ToolImplOutput, DialogMessages
-from utils.llm_client import LLMClient, TextResult, TextPrompt
+from utils.llm_client import LLMClient, TextPrompt
 from utils.workspace_manager import WorkspaceManager
 
 
+# Directories never scanned for Python files
+_SKIP_DIRS = frozenset({'.venv', 'venv', '__pycache__', '.git'})
+
+# Words suggesting a bug when the analysis has no BUGS_FOUND/NO_BUGS prefix
+_BUG_INDICATORS = ("error", "bug", "issue", "problem", "fix", "wrong", "incorrect", "fails")
+_BUG_INDICATORS_RE = re.compile("|".join(_BUG_INDICATORS), re.IGNORECASE)
+
+# Maximum number of analyses kept in the BugHunterTool result cache.
+_ANALYSIS_CACHE_SIZE = 512
+
+
+def _read_text(file_path: str) -> str:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 class BugHunterTool(LLMTool):
     """A simple tool that analyzes code for bugs."""
     
@@ -38,12 +59,36 @@ class BugHunterTool(LLMTool):
         self.client = client
         self.workspace_manager = workspace_manager
         self.logger = logging.getLogger(__name__)
+        # LRU cache of analyses, keyed on a digest of the model name and the code
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_key(self, code: str) -> bytes:
+        """Digest identifying an analysis of `code` by the current model."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(getattr(self.client, "model_name", "").encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(code.encode("utf-8"))
+        return hasher.digest()
     
     def run_impl(self, tool_input: dict[str, Any], dialog_messages: Optional[DialogMessages] = None) -> ToolImplOutput:
         """Analyze code for bugs and return a report."""
         code = tool_input["code"]
         file_path = tool_input.get("file_path", "unknown")
         
+        key = self._cache_key(code)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            self.logger.info(f"Reusing cached analysis for {file_path}")
+            return ToolImplOutput(
+                tool_output=cached,
+                tool_result_message=f"Bug analysis completed for {file_path}",
+                auxiliary_data={"success": True}
+            )
+
         self.logger.info(f"Analyzing code in {file_path}")
         
         prompt = f"""Analyze this code for bugs and issues:
@@ -67,23 +112,33 @@ Be specific about what's wrong and suggest fixes."""
                 temperature=0.1
             )
             
-            if response and isinstance(response[0], TextResult):
-                analysis_result = response[0].text
-                return ToolImplOutput(
-                    tool_output=analysis_result,
-                    tool_result_message=f"Bug analysis completed for {file_path}"
-                )
-            else:
+            # Only a TextResult carries .text; an empty response or any other
+            # block type means the analysis failed
+            try:
+                analysis_result = response[0].text  # pyright: ignore[reportAttributeAccessIssue]
+            except (IndexError, AttributeError):
                 return ToolImplOutput(
                     tool_output="Failed to analyze code",
-                    tool_result_message="Bug analysis failed"
+                    tool_result_message="Bug analysis failed",
+                    auxiliary_data={"success": False}
                 )
+
+            with self._cache_lock:
+                self._cache[key] = analysis_result
+                if len(self._cache) > _ANALYSIS_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            return ToolImplOutput(
+                tool_output=analysis_result,
+                tool_result_message=f"Bug analysis completed for {file_path}",
+                auxiliary_data={"success": True}
+            )
                 
         except Exception as e:
             self.logger.error(f"Error in bug analysis: {e}")
             return ToolImplOutput(
                 tool_output=f"Error during analysis: {str(e)}",
-                tool_result_message="Bug analysis failed"
+                tool_result_message="Bug analysis failed",
+                auxiliary_data={"success": False, "error": str(e)}
             )
 
 
@@ -95,18 +150,28 @@ class ParallelBugHunter:
         client: LLMClient,
         workspace_manager: WorkspaceManager,
         logger: logging.Logger,
-        check_interval: float = 5.0
+        check_interval: float = 5.0,
+        max_concurrent: int = 8
     ):
         self.client = client
         self.workspace_manager = workspace_manager
         self.logger = logger
         self.check_interval = check_interval
+        # Limits how many files are analyzed by the LLM at the same time. An
+        # asyncio.Semaphore binds to the loop that first waits on it, so start()
+        # replaces it for every loop the hunter is (re)started on.
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         
         self.bug_hunter_tool = BugHunterTool(client, workspace_manager)
         self.is_running = False
         self.task: Optional[asyncio.Task] = None
+        # (mtime, size) of each file as of its last successful analysis
+        self._file_fingerprints: dict[str, tuple[float, int]] = {}
+        # Modification time of each Python file as of the previous scan
+        self._seen: dict[str, float] = {}
         
-        self.on_bugs_found = None
+        self.on_bugs_found: Optional[Callable[[str, str], None]] = None
     
     async def start(self):
         """Start the bug hunter."""
@@ -114,6 +179,7 @@ class ParallelBugHunter:
             return
             
         self.is_running = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
         self.task = asyncio.create_task(self._monitor_loop())
         self.logger.info("Parallel bug hunter started")
         
@@ -130,21 +196,38 @@ class ParallelBugHunter:
     
     async def _monitor_loop(self):
         """Main monitoring loop."""
-        last_files = set()
-        
         while self.is_running:
             try:
                 current_files = self._get_python_files()
                 
-                new_files = current_files - last_files
+                changed_files = [
+                    file_path for file_path, mtime in current_files.items()
+                    # != rather than > so files restored with an older mtime are rechecked
+                    if mtime != self._seen.get(file_path)
+                ]
                 
-                if new_files:
-                    self.logger.info(f"Found {len(new_files)} new Python files")
+                if changed_files:
+                    self.logger.info(f"Found {len(changed_files)} new or modified Python files")
                     
-                    for file_path in new_files:
-                        await self._check_file(file_path)
+                    finished = await asyncio.gather(
+                        *(self._check_file(file_path) for file_path in changed_files),
+                        return_exceptions=True
+                    )
+                    
+                    # Keep the previous mtime of files whose check failed so the
+                    # next scan picks them up again
+                    for file_path, done in zip(changed_files, finished):
+                        if done is not True:
+                            if file_path in self._seen:
+                                current_files[file_path] = self._seen[file_path]
+                            else:
+                                del current_files[file_path]
+                
+                # Forget analyses of files that have been deleted
+                for file_path in self._file_fingerprints.keys() - current_files.keys():
+                    del self._file_fingerprints[file_path]
                 
-                last_files = current_files
+                self._seen = current_files
                 await asyncio.sleep(self.check_interval)
                 
             except asyncio.CancelledError:
@@ -153,36 +236,58 @@ class ParallelBugHunter:
                 self.logger.error(f"Error in monitoring: {e}")
                 await asyncio.sleep(self.check_interval)
     
-    def _get_python_files(self) -> set:
-        """Get all Python files in workspace."""
-        python_files = set()
+    def _get_python_files(self) -> dict[str, float]:
+        """Get all Python files in workspace, mapped to their modification times."""
+        python_files: dict[str, float] = {}
         
         try:
-            for root, dirs, files in os.walk(self.workspace_manager.root):
-                # Skip virtual environment directories
-                dirs[:] = [d for d in dirs if d not in ['.venv', 'venv', '__pycache__', '.git']]
+            pending = [os.fspath(self.workspace_manager.root)]
+            while pending:
+                try:
+                    entries = os.scandir(pending.pop())
+                except OSError:
+                    continue
                 
-                for file in files:
-                    if file.endswith('.py'):
-                        file_path = os.path.join(root, file)
-                        python_files.add(file_path)
+                with entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # Skip virtual environment directories
+                                if entry.name not in _SKIP_DIRS:
+                                    pending.append(entry.path)
+                            elif entry.name.endswith('.py'):
+                                # Interned so every scan shares one string per path
+                                python_files[sys.intern(entry.path)] = entry.stat().st_mtime
+                        except OSError:
+                            continue
         except Exception as e:
             self.logger.error(f"Error getting Python files: {e}")
         
         return python_files
     
-    async def _check_file(self, file_path: str):
-        """Check a file for bugs."""
+    async def _check_file(self, file_path: str) -> bool:
+        """Check a file for bugs.
+
+        Returns:
+            True if the file was analyzed or deliberately skipped, False if the
+            check failed and the file should be checked again on the next scan.
+        """
         try:
+            st = os.stat(file_path)
+            fingerprint = (st.st_mtime, st.st_size)
+
             # Skip large files
-            if os.path.getsize(file_path) > 50000:
-                return
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                code = f.read()
+            if st.st_size > 50000:
+                return True
+
+            # Unchanged since the last analysis, nothing new to report
+            if self._file_fingerprints.get(file_path) == fingerprint:
+                return True
+
+            code = await asyncio.to_thread(_read_text, file_path)
             
             if len(code) < 50:
-                return
+                return True
             
             self.logger.info(f"Checking {file_path} for bugs")
             
@@ -191,24 +296,35 @@ class ParallelBugHunter:
                 "file_path": file_path
             }
             
-            result = self.bug_hunter_tool.run_impl(tool_input)
+            async with self._semaphore:
+                result = await asyncio.to_thread(self.bug_hunter_tool.run_impl, tool_input)
+            if not result.auxiliary_data.get("success"):
+                # Error text is not a bug report; leave the file to be checked again
+                self.logger.error(f"Bug analysis failed for {file_path}")
+                return False
+            
+            self._file_fingerprints[file_path] = fingerprint
             
-            analysis_text = result.tool_output.lower()
-            if analysis_text.startswith("bugs_found"):
+            analysis_text = result.tool_output
+            # Only the prefix needs case folding; "bugs_found" is the longest marker
+            prefix = analysis_text[:10].lower()
+            if prefix.startswith("bugs_found"):
                 self.logger.warning(f"Bugs found in {file_path}")
                 
                 if self.on_bugs_found:
                     self.on_bugs_found(file_path, result.tool_output)
 
-            elif analysis_text.startswith("no_bugs"):
+            elif prefix.startswith("no_bugs"):
                 self.logger.info(f"No bugs found in {file_path}")
             else:
                 # Fallback: check for common bug indicators
-                bug_indicators = ["error", "bug", "issue", "problem", "fix", "wrong", "incorrect", "fails"]
-                if any(indicator in analysis_text for indicator in bug_indicators):
+                if _BUG_INDICATORS_RE.search(analysis_text):
                     self.logger.warning(f"Potential bugs found in {file_path} (fallback detection)")
                     if self.on_bugs_found:
                         self.on_bugs_found(file_path, result.tool_output)
+            
+            return True
                 
         except Exception as e:
-            self.logger.error(f"Error checking file {file_path}: {e}")
\ No newline at end of file
+            self.logger.error(f"Error checking file {file_path}: {e}")
+            return False
\ No newline at end of file
@@ -0,0 +1,219 @@
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+from tools.bug_hunter import BugHunterTool, ParallelBugHunter
+from utils.llm_client import TextResult, ToolCall
+
+
+def build_client(text="NO_BUGS"):
+    client = MagicMock()
+    client.model_name = "test-model"
+    client.generate.return_value = ([TextResult(text=text)], {})
+    return client
+
+
+def test_run_impl_caches_analysis_by_code():
+    client = build_client()
+    tool = BugHunterTool(client=client, workspace_manager=MagicMock())
+
+    first = tool.run_impl({"code": "x = 1", "file_path": "a.py"})
+    second = tool.run_impl({"code": "x = 1", "file_path": "b.py"})
+
+    assert first.tool_output == "NO_BUGS"
+    assert first.auxiliary_data["success"]
+    assert second.tool_output == "NO_BUGS"
+    assert second.auxiliary_data["success"]
+    assert "b.py" in second.tool_result_message
+    assert client.generate.call_count == 1
+
+    tool.run_impl({"code": "x = 2", "file_path": "a.py"})
+    assert client.generate.call_count == 2
+
+
+def test_run_impl_does_not_cache_failures():
+    client = build_client()
+    client.generate.side_effect = [RuntimeError("boom"), ([TextResult(text="NO_BUGS")], {})]
+    tool = BugHunterTool(client=client, workspace_manager=MagicMock())
+
+    failed = tool.run_impl({"code": "x = 1"})
+    assert not failed.auxiliary_data["success"]
+
+    result = tool.run_impl({"code": "x = 1"})
+    assert result.tool_output == "NO_BUGS"
+    assert client.generate.call_count == 2
+
+
+def test_get_python_files_skips_ignored_dirs(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1")
+    (tmp_path / "notes.txt").write_text("x = 1")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "b.py").write_text("x = 1")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "c.py").write_text("x = 1")
+    workspace_manager = MagicMock()
+    workspace_manager.root = tmp_path
+
+    hunter = ParallelBugHunter(
+        client=build_client(), workspace_manager=workspace_manager, logger=MagicMock()
+    )
+    files = hunter._get_python_files()
+
+    assert set(files) == {str(tmp_path / "a.py"), str(tmp_path / "pkg" / "b.py")}
+    assert files[str(tmp_path / "a.py")] == os.stat(tmp_path / "a.py").st_mtime
+
+
+def test_check_file_skips_unchanged_files(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("def add(a, b):\n    return a + b\n\n\nprint(add(1, 2))\n")
+    client = build_client("BUGS_FOUND: off by one")
+    hunter = ParallelBugHunter(
+        client=client, workspace_manager=MagicMock(), logger=MagicMock()
+    )
+    on_bugs_found = MagicMock()
+    hunter.on_bugs_found = on_bugs_found
+
+    asyncio.run(hunter._check_file(str(source)))
+    asyncio.run(hunter._check_file(str(source)))
+
+    assert client.generate.call_count == 1
+    on_bugs_found.assert_called_once_with(str(source), "BUGS_FOUND: off by one")
+
+
+def test_run_impl_reports_failure_without_text_result():
+    client = build_client()
+    client.generate.return_value = ([ToolCall(tool_call_id="1", tool_name="x", tool_input={})], {})
+    tool = BugHunterTool(client=client, workspace_manager=MagicMock())
+
+    result = tool.run_impl({"code": "x = 1"})
+    assert result.tool_output == "Failed to analyze code"
+    assert not result.auxiliary_data["success"]
+
+    client.generate.return_value = ([], {})
+    result = tool.run_impl({"code": "x = 1"})
+    assert result.tool_output == "Failed to analyze code"
+    assert not result.auxiliary_data["success"]
+
+
+def test_check_file_does_not_report_failed_analysis(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("def add(a, b):\n    return a + b\n\n\nprint(add(1, 2))\n")
+    client = build_client()
+    client.generate.side_effect = RuntimeError("connection error")
+    hunter = ParallelBugHunter(
+        client=client, workspace_manager=MagicMock(), logger=MagicMock()
+    )
+    on_bugs_found = MagicMock()
+    hunter.on_bugs_found = on_bugs_found
+
+    asyncio.run(hunter._check_file(str(source)))
+
+    on_bugs_found.assert_not_called()
+    assert hunter._file_fingerprints == {}
+
+
+def test_monitor_loop_retries_file_after_failed_analysis(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("def add(a, b):\n    return a + b\n\n\nprint(add(1, 2))\n")
+    workspace_manager = MagicMock()
+    workspace_manager.root = tmp_path
+    client = build_client()
+    client.generate.side_effect = [
+        RuntimeError("connection error"),
+        ([TextResult(text="NO_BUGS")], {}),
+    ]
+    hunter = ParallelBugHunter(
+        client=client,
+        workspace_manager=workspace_manager,
+        logger=MagicMock(),
+        check_interval=0.01,
+    )
+
+    async def run_monitor():
+        await hunter.start()
+        await asyncio.sleep(0.2)
+        await hunter.stop()
+
+    asyncio.run(run_monitor())
+
+    assert client.generate.call_count == 2
+    assert str(source) in hunter._file_fingerprints
+
+
+def test_monitor_loop_rechecks_file_when_mtime_moves_backwards(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("def add(a, b):\n    return a + b\n\n\nprint(add(1, 2))\n")
+    os.utime(source, (2_000_000_000, 2_000_000_000))
+    workspace_manager = MagicMock()
+    workspace_manager.root = tmp_path
+    client = build_client()
+    hunter = ParallelBugHunter(
+        client=client,
+        workspace_manager=workspace_manager,
+        logger=MagicMock(),
+        check_interval=0.01,
+    )
+
+    async def run_monitor():
+        await hunter.start()
+        await asyncio.sleep(0.1)
+        source.write_text("def add(a, b):\n    return a - b\n\n\nprint(add(1, 2))\n")
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        await asyncio.sleep(0.1)
+        await hunter.stop()
+
+    asyncio.run(run_monitor())
+
+    assert client.generate.call_count == 2
+
+
+def test_monitor_loop_limits_concurrency_across_restarts(tmp_path):
+    workspace_manager = MagicMock()
+    workspace_manager.root = tmp_path
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def generate(**kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return [TextResult(text="NO_BUGS")], {}
+
+    client = build_client()
+    client.generate.side_effect = generate
+    logger = MagicMock()
+    hunter = ParallelBugHunter(
+        client=client,
+        workspace_manager=workspace_manager,
+        logger=logger,
+        check_interval=0.01,
+        max_concurrent=2,
+    )
+
+    def write_files(version):
+        for i in range(5):
+            (tmp_path / f"m{i}.py").write_text(
+                f"def compute_value_{i}():\n    return {version} * {i}\n\n\nprint(compute_value_{i}())\n"
+            )
+
+    async def run_monitor():
+        await hunter.start()
+        await asyncio.sleep(0.5)
+        await hunter.stop()
+
+    # Each run uses a new event loop, as Agent does when the hunter restarts
+    write_files(1)
+    asyncio.run(run_monitor())
+    write_files(2)
+    asyncio.run(run_monitor())
+
+    assert client.generate.call_count == 10
+    assert max_in_flight == 2
+    logger.error.assert_not_called()
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+from tools.web_search_tool import WebSearchTool
+from utils.llm_client import TextResult
+
+
+def build_tool():
+    client = MagicMock()
+    client.generate.return_value = ([TextResult(text="summary")], {})
+    with patch("tools.web_search_tool.get_client", return_value=client):
+        tool = WebSearchTool(workspace_manager=MagicMock())
+    return tool, client
+
+
+def test_analysis_is_cached_per_query_and_results():
+    tool, client = build_tool()
+
+    assert tool._analyse_with_gpt5("query", "results") == "summary"
+    assert tool._analyse_with_gpt5("query", "results") == "summary"
+    assert client.generate.call_count == 1
+
+    tool._analyse_with_gpt5("query", "other results")
+    tool._analyse_with_gpt5("other query", "results")
+    assert client.generate.call_count == 3
+
+
+def test_failed_analysis_is_not_cached():
+    tool, client = build_tool()
+    client.generate.side_effect = [RuntimeError("boom"), ([TextResult(text="summary")], {})]
+
+    assert tool._analyse_with_gpt5("query", "results").startswith("Error analyzing results")
+    assert tool._analyse_with_gpt5("query", "results") == "summary"
+    assert client.generate.call_count == 2
+
+
+def test_run_impl_async_runs_searches_concurrently():
+    tool, _ = build_tool()
+    results = [{"title": "T", "url": "https://example.com", "snippet": "S"}]
+    # Each search waits until both are in flight, so running them one after
+    # the other breaks the barrier and the searches fail
+    barrier = threading.Barrier(2, timeout=5)
+
+    def google_search(query):
+        barrier.wait()
+        return results
+
+    search = MagicMock(side_effect=google_search)
+    tool._google_search = search
+
+    async def run_searches():
+        return await asyncio.gather(
+            tool.run_impl_async({"query": "first"}),
+            tool.run_impl_async({"query": "second"}),
+        )
+
+    first, second = asyncio.run(run_searches())
+
+    assert search.call_count == 2
+    search.side_effect = None
+    search.return_value = results
+    assert first == tool.run_impl({"query": "first"})
+    assert second == tool.run_impl({"query": "second"})
+    assert first.tool_output == "summary"
+    assert second.tool_result_message == "Searched for: second"
+
+
+def test_google_search_parses_items_and_skips_ones_without_link():
+    tool, _ = build_tool()
+    tool.api_key = "key"
+    tool.search_engine_id = "engine"
+    response = MagicMock()
+    response.content = (
+        b'{"items": ['
+        b'{"title": "Docs", "link": "https://docs.example.com", "snippet": "Reference"},'
+        b'{"link": "https://example.com/untitled"},'
+        b'{"title": "No link"}'
+        b"]}"
+    )
+    tool._session = MagicMock()
+    tool._session.get.return_value = response
+
+    results = tool._google_search("query")
+
+    assert results == [
+        {"title": "Docs", "url": "https://docs.example.com", "snippet": "Reference"},
+        {"title": "", "url": "https://example.com/untitled", "snippet": ""},
+    ]
+    assert tool._session.get.call_args.kwargs["params"]["q"] == "query"
@@ -6,12 +6,27 @@ This tool allows the agent to search the web for information and uses GPT-5 to a
 from utils.common import LLMTool, ToolImplOutput, DialogMessages
 from typing import Any, Optional
 from utils.workspace_manager import WorkspaceManager
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from utils.llm_client import get_client, TextPrompt
 
 logger = logging.getLogger(__name__)
-import requests
 import os
+import threading
+import zlib
+
+try:
+    from orjson import loads as _json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from json import loads as _json_loads
+
+_SPACE_TO_DASH = str.maketrans({" ": "-"})
+_SPACE_TO_PLUS = str.maketrans({" ": "+"})
+
+# Maximum number of GPT analyses kept in the WebSearchTool result cache.
+_ANALYSIS_CACHE_SIZE = 256
 
 class WebSearchTool(LLMTool):
     name = "web_search"
@@ -32,10 +47,40 @@ class WebSearchTool(LLMTool):
         self.workspace_manager = workspace_manager
         
         self.gpt5_client = get_client("openai-direct", model_name="gpt-4o", cot_model=True)
+
+        self.api_key = os.getenv("GOOGLE_API_KEY")
+        self.search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+
+        # Reuse connections (and TLS sessions) to the search API across queries.
+        # Created on first search so requests is only imported when it is needed.
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # LRU cache of analyses, keyed on the query and a digest of the search results
+        self._analysis_cache: OrderedDict[tuple[str, bytes], str] = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+
+    def _get_session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self._session = requests.Session()
+                self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+            return self._session
     
     def _analyse_with_gpt5(self, query: str, results: str) -> str:
         if not self.gpt5_client:
             return "GPT-4o analysis unavailable"
+
+        key = (query, hashlib.blake2s(results.encode("utf-8"), digest_size=16).digest())
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+                return cached
+
         prompt = f"""What's the most important information from these search results for "{query}"?
 
 Results:
@@ -48,7 +93,14 @@ Give a brief, direct answer focusing on the key information only."""
                 max_tokens=200,
                 temperature=0.1
             )
-            return response[0].text if response else "No analysis available"
+            if not response:
+                return "No analysis available"
+            analysis = response[0].text
+            with self._analysis_cache_lock:
+                self._analysis_cache[key] = analysis
+                if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                    self._analysis_cache.popitem(last=False)
+            return analysis
         except Exception as e:
             logger.error(f"Error calling GPT-4o for analysis: {e}")
             return f"Error analyzing results: {str(e)}"
@@ -72,42 +124,43 @@ Give a brief, direct answer focusing on the key information only."""
             logger.error(f"Error in web search tool: {e}")
             return ToolImplOutput(f"Error performing web search: {str(e)}", "Search failed")
 
+    async def run_impl_async(self, tool_input: dict[str, Any], dialog_messages: Optional[DialogMessages] = None) -> ToolImplOutput:
+        """Run the search in a worker thread so several queries can be awaited concurrently."""
+        return await asyncio.to_thread(self.run_impl, tool_input, dialog_messages)
+
 
     def _google_search(self, query: str) -> list[dict[str, str]]:
         """Perform real web search using Google Custom Search API."""
         
-        api_key = os.getenv("GOOGLE_API_KEY")
-        search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
-        
-        if not api_key or not search_engine_id:
+        if not self.api_key or not self.search_engine_id:
             logger.warning("Google API credentials not set, falling back to mock search")
             raise ValueError("Google API credentials not set")
 
+        import requests
+
         url = "https://www.googleapis.com/customsearch/v1"
         
         params = {
-            "key": api_key,
-            "cx": search_engine_id,
+            "key": self.api_key,
+            "cx": self.search_engine_id,
             "q": query,
             "num": 5,
             "safe": "active"
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            
-            results = []
-            for item in data.get("items", []):
-                results.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("link", ""),
-                    "snippet": item.get("snippet", "")
-                })
+            data = _json_loads(response.content)
             
-            return results
+            # Items without a link are useless to the agent, so they are dropped
+            # rather than failing the whole response
+            return [
+                {"title": item.get("title", ""), "url": item["link"], "snippet": item.get("snippet", "")}
+                for item in data.get("items", ())
+                if "link" in item
+            ]
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Google API request failed: {e}")
@@ -118,20 +171,22 @@ Give a brief, direct answer focusing on the key information only."""
     
     def _mock_web_search(self, query: str) -> list[dict[str, str]]:
         """Mock web search for testing purposes."""
+        # crc32 is stable across interpreter runs, unlike the randomized hash()
+        question_id = zlib.crc32(query.encode("utf-8")) % 1_000_000
         mock_results = [
             {
                 "title": f"Documentation: {query}",
-                "url": f"https://docs.example.com/{query.replace(' ', '-')}",
+                "url": f"https://docs.example.com/{query.translate(_SPACE_TO_DASH)}",
                 "snippet": f"Official documentation for {query} with examples and API reference.",
             },
             {
                 "title": f"Stack Overflow: {query}",
-                "url": f"https://stackoverflow.com/questions/{hash(query) % 1000000}",
+                "url": f"https://stackoverflow.com/questions/{question_id}",
                 "snippet": f"Common questions and answers about {query} from the developer community.",
             },
             {
                 "title": f"GitHub: {query} examples",
-                "url": f"https://github.com/search?q={query.replace(' ', '+')}",
+                "url": f"https://github.com/search?q={query.translate(_SPACE_TO_PLUS)}",
                 "snippet": f"Open source projects and code examples related to {query}.",
             },
         ]